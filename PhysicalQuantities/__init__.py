@@ -26,7 +26,7 @@ without explicitly calling a function constructor
 import collections
 
 from .quantity import PhysicalQuantity
-from .unit import unit_table, addunit, isphysicalunit, PhysicalUnit
+from .unit import unit_table, addunit, isphysicalunit, PhysicalUnit, _unit_table_caches, _clear_unit_table_caches
 from .prefixes import *
 from .default_units import *
 from .dBQuantity import dBQuantity, dB_unit_table
@@ -66,6 +66,12 @@ class _Quantity:
             self.table[key] = dBQuantity(1, key)
         for key in unit_table:
             self.table[key] = PhysicalQuantity(1, unit_table[key])
+        # store units as instance attributes, so q.m does not need to go through __getattr__
+        for key in self.table:
+            if key.isidentifier() and key != 'table' and not hasattr(type(self), key):
+                self.__dict__[key] = self.table[key]
+        # caches like the lines transformed by the IPython extension depend on the known units
+        _clear_unit_table_caches()
 
     def __dir__(self):
         return self.table.keys()
@@ -114,6 +120,11 @@ def isphysicalquantity(x) -> bool:
     return isinstance(x, (PhysicalQuantity, dBQuantity))
 
 
+# HTML table of units_html_list(), cleared when units are added to the unit_table
+_units_html_table: dict[str, str] = {}
+_unit_table_caches.append(_units_html_table.clear)
+
+
 def units_html_list():
     """ List all defined units in a HTML table
 
@@ -121,20 +132,25 @@ def units_html_list():
     -------
     str
         HTML formatted list of all defined units
+
+    Notes
+    -----
+    The table is cached and rebuilt after units were added with `addunit` or `add_composite_unit`.
     """
     from IPython.display import HTML  # type: ignore
-    table = "<table>"
-    table += "<tr><th>Name</th><th>Base Unit</th><th>Quantity</th></tr>"
-    for name in unit_table:
-        _unit = unit_table[name]
-        if isinstance(_unit, PhysicalUnit):
-            if _unit.prefixed is False:
-                a = PhysicalQuantity(1, name)
-                baseunit = a.base._repr_latex_()
-                table += f'<tr><td>{name}</td><td>{baseunit}' + \
-                         f'</td><td><a href="{_unit.url}" target="_blank">{_unit.verbosename}</a></td></tr>'
-    table += "</table>"
-    return HTML(table)
+    if 'html' not in _units_html_table:
+        rows = ["<table>", "<tr><th>Name</th><th>Base Unit</th><th>Quantity</th></tr>"]
+        for name in unit_table:
+            _unit = unit_table[name]
+            if isinstance(_unit, PhysicalUnit):
+                if _unit.prefixed is False:
+                    a = PhysicalQuantity(1, name)
+                    baseunit = a.base._repr_latex_()
+                    rows.append(f'<tr><td>{name}</td><td>{baseunit}'
+                                f'</td><td><a href="{_unit.url}" target="_blank">{_unit.verbosename}</a></td></tr>')
+        rows.append("</table>")
+        _units_html_table['html'] = ''.join(rows)
+    return HTML(_units_html_table['html'])
 
 
 def units_list():
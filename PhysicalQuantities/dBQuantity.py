@@ -24,6 +24,11 @@ __all__ = ['dB10', 'dB20', 'PhysicalQuantity_to_dBQuantity', 'dBQuantity', 'dB_u
 # Dynamically generated list of all dB units
 dB_unit_table = {}
 
+# Cache of dB units matching a linear unit, (unit name, base unit name) -> (dB unit name, convert to base)
+_dB_unit_cache: dict[tuple[str, str], tuple[str, bool]] = {}
+
+_LOG2_10 = np.log2(10)
+
 
 class dBUnit:
     """Class for handling dB units
@@ -38,12 +43,17 @@ class dBUnit:
         Offset, used e.g. for dBd vs. dBi
     factor:
         Factur for dB <-> linear conversion
+    inv_factor: float
+        log2(10)/factor, precomputed for dB -> linear conversion using exp2()
     """
+    __slots__ = ('name', 'physicalunit', 'offset', 'factor', 'z0', 'inv_factor')
+
     name: str
     physicalunit: PhysicalUnit
     offset: float
     factor: float
     z0: PhysicalQuantity
+    inv_factor: float
 
     def __init__(self, name: str, physicalunit: PhysicalUnit, offset: float = 0, factor: int = 0,
                  z0=PhysicalQuantity(50, 'Ohm')):
@@ -67,7 +77,9 @@ class dBUnit:
             self.factor = 10 if self.physicalunit.is_power else 20
         except AttributeError:
             self.factor = factor
+        self.inv_factor = _LOG2_10 / self.factor if self.factor else 0.
         dB_unit_table[name] = self
+        _dB_unit_cache.clear()
 
     @property
     def is_power(self) -> bool:
@@ -100,6 +112,42 @@ _add_dB_units('dBi', unit=None, factor=10)
 _add_dB_units('dBc', unit=None, factor=10)
 
 
+def _find_dB_unit(unit: PhysicalUnit) -> tuple[str | None, bool]:
+    """ Find the dB unit matching a linear unit
+
+    Parameters
+    ----------
+    unit:
+        Linear unit
+
+    Returns
+    -------
+    tuple
+        Name of dB unit or None if there is no matching dB unit, and True if the value
+        has to be converted to base units first
+    """
+    name = unit.name
+    basename = unit.baseunit.name
+    try:
+        return _dB_unit_cache[(name, basename)]
+    except KeyError:
+        pass
+    dbbase = None
+    tobase = False
+    for key in dB_unit_table:
+        if dB_unit_table[key].physicalunit is not None and dB_unit_table[key].physicalunit.name == name:
+            dbbase = key
+            tobase = False
+            break
+        elif dB_unit_table[key].physicalunit is not None and dB_unit_table[key].physicalunit.baseunit.name == \
+                basename:
+            dbbase = key
+            tobase = True
+    if dbbase is not None:
+        _dB_unit_cache[(name, basename)] = (dbbase, tobase)
+    return dbbase, tobase
+
+
 def PhysicalQuantity_to_dBQuantity(x: PhysicalQuantity, dBunitname: str | None = None):
     """ Conversion from a PhysicalQuantity to correct dB<x> value
 
@@ -125,15 +173,9 @@ def PhysicalQuantity_to_dBQuantity(x: PhysicalQuantity, dBunitname: str | None =
                 value = x.to(dB_unit_table[dBunitname].physicalunit.name).value
                 _unit = dB_unit_table[dBunitname].physicalunit  # FIXME
         else:
-            for key in dB_unit_table:
-                if dB_unit_table[key].physicalunit is not None and dB_unit_table[key].physicalunit.name == x.unit.name:
-                    dbbase = key
-                    value = x.value
-                    break
-                elif dB_unit_table[key].physicalunit is not None and dB_unit_table[key].physicalunit.baseunit.name == \
-                        x.unit.baseunit.name:
-                    dbbase = key
-                    value = x.base.value
+            dbbase, tobase = _find_dB_unit(x.unit)
+            if dbbase is not None:
+                value = x.base.value if tobase else x.value
         _unit = x.unit
         if dbbase is None:
             raise UnitError(f'Cannot handle unit {x.unit}')
@@ -183,6 +225,44 @@ def dB20(x) -> dBQuantity:
     return dBQuantity(20*np.log10(val), 'dB', islog=True)
 
 
+def _lin_sum(val1, val2, unit: dBUnit, sign=1):
+    """ Add or subtract array valued dB values in the linear domain
+
+    Computes factor*log10(10^(val1/factor) + sign*10^(val2/factor)) using two preallocated
+    buffers, instead of creating a new array for each intermediate result.
+
+    Parameters
+    ----------
+    val1: array_like
+        First dB value
+    val2: array_like
+        Second dB value
+    unit: dBUnit
+        dB unit of both values
+    sign: int
+        +1 for addition, -1 for subtraction
+
+    Returns
+    -------
+    np.ndarray
+        dB value of the sum or difference
+    """
+    inv = unit.inv_factor
+    tmp1 = np.empty(np.broadcast(val1, val2).shape)
+    tmp2 = np.empty_like(tmp1)
+    np.multiply(val1, inv, out=tmp1)
+    np.exp2(tmp1, out=tmp1)
+    np.multiply(val2, inv, out=tmp2)
+    np.exp2(tmp2, out=tmp2)
+    if sign < 0:
+        np.subtract(tmp1, tmp2, out=tmp1)
+    else:
+        np.add(tmp1, tmp2, out=tmp1)
+    np.log2(tmp1, out=tmp1)
+    np.multiply(tmp1, 1 / inv, out=tmp1)
+    return tmp1
+
+
 class dBQuantity:
     """ dB scaled physical quantity with units.
 
@@ -332,12 +412,18 @@ class dBQuantity:
         raise UnitError('Cannot convert to unit %s' % unitname)
 
     def __deepcopy__(self, memo: dict):
-        """ Return a copy of the PhysicalQuantity including the value.
-            Needs deepcopy to copy the value
+        """ Return a copy of the dBQuantity including the value.
+            The dB unit is shared, only the value is copied
         """
-        new_value = copy.deepcopy(self.value)
-        new_instance = self.__class__(new_value, self.unit.name, islog=True)
+        new_instance = self.__class__.__new__(self.__class__)
         memo[id(self)] = new_instance
+        if isinstance(self.value, np.ndarray):
+            new_instance.value = np.copy(self.value)
+        else:
+            new_instance.value = copy.deepcopy(self.value, memo)
+        new_instance.unit = self.unit
+        new_instance.ptformatter = self.ptformatter
+        new_instance.format = self.format
         return new_instance
 
     def __getitem__(self, key):
@@ -472,6 +558,11 @@ class dBQuantity:
             return self.__class__(value, unit, islog=True)
         elif dB_unit_table[self.unit.name] is dB_unit_table[other.unit.name]:
             # same unit adding
+            if isinstance(self.value, np.ndarray) or isinstance(other.value, np.ndarray):
+                if self.unit.factor == 0:
+                    raise UnitError('Cannot convert dB unit with unknown factor to linear')
+                value = _lin_sum(self.value, other.value, self.unit) - self.unit.offset
+                return self.__class__(value, self.unit.name, islog=True)
             val1 = float(self)
             val2 = float(other)
             return self.__class__(val1+val2, self.unit.name, islog=False)
@@ -501,6 +592,11 @@ class dBQuantity:
             return self.__class__(value, self.unit.name, islog=True)
         elif self.unit.physicalunit is other.unit.physicalunit:
             # same unit subtraction
+            if isinstance(self.value, np.ndarray) or isinstance(other.value, np.ndarray):
+                if self.unit.factor == 0:
+                    raise UnitError('Cannot convert dB unit with unknown factor to linear')
+                value = _lin_sum(self.value, other.value, self.unit, -1) - self.unit.offset
+                return self.__class__(value, self.unit.name, islog=True)
             val1 = float(self)
             val2 = float(other)
             return self.__class__(val1-val2, self.unit.name, islog=False)
@@ -18,63 +18,42 @@ class FractionalDict(dict):
 
     def __add__(self, other: FractionalDict) -> FractionalDict:
         """Return the sum of self and other."""
-        sum_dict = FractionalDict()
-        for key in self.keys() | other.keys():
-            sum_dict[key] = self[key] + other[key]
+        sum_dict = FractionalDict(self)
+        for key, value in other.items():
+            sum_dict[key] = sum_dict.get(key, 0) + value
         return sum_dict
 
     def __sub__(self, other: FractionalDict) -> FractionalDict:
         """Return the difference of self and other."""
-        sub_dict = FractionalDict()
-        for key in self.keys() | other.keys():
-            sub_dict[key] = self[key] - other[key]
+        sub_dict = FractionalDict(self)
+        for key, value in other.items():
+            sub_dict[key] = sub_dict.get(key, 0) - value
         return sub_dict
 
     def __mul__(self, other: Fraction) -> FractionalDict:
         """Return the product of self and other."""
-        new = FractionalDict()
-        for key in self.keys():
-            new[key] = other*self[key]
-        return new
+        return FractionalDict({key: other*value for key, value in self.items()})
 
     def __truediv__(self, other: Fraction) -> FractionalDict:
         """Return the quotient of self and other."""
-        new = FractionalDict()
-        for key in self.keys():
-            new[key] = self[key]/other
-        return new
+        return FractionalDict({key: value/other for key, value in self.items()})
 
     def __floordiv__(self, other: Fraction) -> FractionalDict:
         """Return the floored quotient of self and other."""
-        new = FractionalDict()
-        for key in self.keys():
-            new[key] = self[key] / other
-        return new
+        return FractionalDict({key: value / other for key, value in self.items()})
 
     def __rdiv__(self, other: Fraction) -> FractionalDict:
         """Return the quotient of other and self."""
-        new = FractionalDict()
-        for key in self.keys():
-            new[key] = other/self[key]
-        return new
+        return FractionalDict({key: other/value for key, value in self.items()})
 
     def __rmul__(self, other: Fraction) -> FractionalDict:
         """Return the product of self and other."""
-        new = FractionalDict()
-        for key in self.keys():
-            new[key] = other*self[key]
-        return new
+        return FractionalDict({key: other*value for key, value in self.items()})
  
     def __rfloordiv__(self, other: Fraction) -> FractionalDict:
         """Return the floored quotient of other and self."""
-        new = FractionalDict()
-        for key in self.keys():
-            new[key] = other / self[key]
-        return new
+        return FractionalDict({key: other / value for key, value in self.items()})
 
     def __rtruediv__(self, other):
         """Return the quotient of other and self."""
-        new = FractionalDict()
-        for key in self.keys():
-            new[key] = other/self[key]
-        return new
+        return FractionalDict({key: other/value for key, value in self.items()})
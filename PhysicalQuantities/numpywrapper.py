@@ -2,7 +2,7 @@ import numpy as np
 from typing import Union
 from . import isphysicalquantity, q
 from .quantity import *
-from .unit import UnitError
+from .unit import UnitError, convertvalue, findunit
 
 __all__ = ['max', 'floor', 'ceil', 'sqrt', 'linspace', 'tophysicalquantity']
 
@@ -131,20 +131,18 @@ def linspace(start, stop, num=50,  endpoint=True, retstep=False):
         return np.linspace(start, stop, num,  endpoint, retstep)
 
     if isinstance(start, PhysicalQuantity) and isinstance(stop, PhysicalQuantity):
-        start.base.unit == stop.base.unit
-
-    unit = None
-    if isinstance(start, PhysicalQuantity):
+        # express both end points in the unit of start, so a single np.linspace call gives the result
+        unit = start.unit
         start_value = start.value
+        stop_value = convertvalue(stop.value, stop.unit, unit)
+    elif isinstance(start, PhysicalQuantity):
         unit = start.unit
+        start_value = start.value
+        stop_value = stop
     else:
+        unit = stop.unit
         start_value = start
-
-    if isinstance(stop, PhysicalQuantity):
         stop_value = stop.value
-        unit = stop.unit
-    else:
-        stop_value = stop
 
     array = np.linspace(start_value, stop_value, num,  endpoint, retstep)
 
@@ -154,7 +152,7 @@ def linspace(start, stop, num=50,  endpoint=True, retstep=False):
         return PhysicalQuantity(array, unit)
 
 
-def tophysicalquantity(arr: np.ndarray | PhysicalQuantity, unit=None):
+def tophysicalquantity(arr: list | np.ndarray | PhysicalQuantity, unit=None):
     """ Convert numpy array or list containing PhysicalQuantity elements to PhysicalQuantity object containing
      array or list
 
@@ -185,9 +183,8 @@ def tophysicalquantity(arr: np.ndarray | PhysicalQuantity, unit=None):
             # convert list to array
             newarr = np.array(pqarr.value)
             return newarr * q[pqarr.unit]
-        if not isinstance(pqarr.value, (list, np.ndarray)):
-            # do nothing for single PQ values
-            return arr
+        # do nothing for single PQ values
+        return pqarr
     else:
         if not isinstance(arr, (list, np.ndarray)):
             if unit is not None:
@@ -202,17 +199,30 @@ def tophysicalquantity(arr: np.ndarray | PhysicalQuantity, unit=None):
 
     if unit is None:
         unit = arr[0].unit
-    valuetype = type(arr[0].value)
+    unit = findunit(unit)
+    valuetype = arr[0].value.dtype if isinstance(arr[0].value, np.ndarray) else type(arr[0].value)
 
-    newarr = np.zeros_like(arr, dtype=valuetype)
+    # collect values and (factor, offset) conversion tuples, then convert all values in one step
+    newarr = np.array([_a.value if isphysicalquantity(_a) else _a for _a in arr])
+    conversion = np.empty((len(arr), 2))
+    conversions: dict[int, tuple[float, float]] = {}  # elements usually share the same unit object
     for i, _a in enumerate(arr):
         if isphysicalquantity(_a):
             try:
-                newarr[i] = _a.to(unit).value
-            except UnitError:
-                raise UnitError('Element %d is not same unit as others' % i)
+                conversion[i] = conversions[id(_a.unit)]
+            except KeyError:
+                try:
+                    conversion[i] = conversions[id(_a.unit)] = _a.unit.conversion_tuple_to(unit)
+                except (UnitError, AttributeError):
+                    raise UnitError('Element %d is not same unit as others' % i)
         else:
-            newarr[i] = _a
+            conversion[i] = (1., 0.)
+    if np.any(conversion != (1., 0.)):
+        # one (factor, offset) row per element, broadcast over the values of array valued elements
+        shape = (-1,) + (1,) * (newarr.ndim - 1)
+        newarr = (newarr + conversion[:, 1].reshape(shape)) * conversion[:, 0].reshape(shape)
+    # cast to the type of the first element only after the conversion
+    newarr = newarr.astype(valuetype)
     return PhysicalQuantity(newarr, unit)  # type: ignore
 
 
@@ -5,12 +5,13 @@ from __future__ import annotations
 
 import copy
 import json
+import operator
 
 import numpy as np
 
 from .unit import (
-    PhysicalUnit, UnitError, base_names, convertvalue, findunit,
-    isphysicalunit, unit_table,
+    PhysicalUnit, UnitError, _unit_table_caches, base_names, convertvalue,
+    findunit, isphysicalunit, unit_table,
 )
 from typing import TYPE_CHECKING
 
@@ -20,6 +21,62 @@ if TYPE_CHECKING:
 __all__ = ['PhysicalQuantity', 'PhysicalUnit', 'UnitError', 'unit_table']
 
 
+def _json_default(obj):
+    """ Convert numpy values that json cannot encode, used as `default` of `json.dumps` """
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def _comparison(op, description: str):
+    """ Create a comparison method of PhysicalQuantity using the operator `op` """
+    def compare(self, other):
+        if isinstance(other, PhysicalQuantity):
+            if self.unit is other.unit:
+                return op(self.value, other.value)
+            if self.unit._signature == other.unit._signature:
+                # compare the values in base units, as given by self.base and other.base
+                return op((self.value + self.unit.offset) * self.unit.factor,
+                          (other.value + other.unit.offset) * other.unit.factor)
+            raise UnitError(f'Cannot compare unit {self.unit} with unit {other.unit}')
+        raise UnitError(f'Cannot compare PhysicalQuantity with type {type(other)}')
+
+    compare.__doc__ = f""" Test if quantity is {description} other
+
+        Parameters
+        ----------
+        other: PhysicalQuantity
+            Quantity to compare against
+
+        Returns
+        -------
+        bool
+            True if quantity is {description} other
+        """
+    # name the method after the dunder it implements, e.g. operator.gt -> __gt__
+    compare.__name__ = f'__{op.__name__}__'
+    compare.__qualname__ = f'PhysicalQuantity.{compare.__name__}'
+    return compare
+
+
+# scaled units per base unit name for autoscale, cleared when units are added to the unit_table
+_autoscale_cache: dict[str, list[tuple[float, str]]] = {}
+_unit_table_caches.append(_autoscale_cache.clear)
+
+
+def _autoscale_units(baseunit: PhysicalUnit) -> list[tuple[float, str]]:
+    """ Return (log10(factor), name) of all units in the unit_table with the given base unit, in table order """
+    # only base units from the unit_table are cached, which bounds the size of the cache
+    cacheable = unit_table.get(baseunit.name) is baseunit
+    if cacheable and baseunit.name in _autoscale_cache:
+        return _autoscale_cache[baseunit.name]
+    units = [(np.log10(u.factor), name) for name, u in unit_table.items()
+             if isinstance(u, PhysicalUnit) and u.baseunit is baseunit]
+    if cacheable:
+        _autoscale_cache[baseunit.name] = units
+    return units
+
+
 class PhysicalQuantity:
     """ Physical quantity with units.
 
@@ -31,13 +88,14 @@ class PhysicalQuantity:
         applicable as well.
     """
 
+    __slots__ = ('value', 'unit', 'format', 'annotation', 'ptformatter')
     __array_priority__: int = 1000  # make sure numpy arrays do not get iterated
-    format: str = ''                # display format for number to string conversion
-    annotation: str = ''            # optional annotation of Quantity
-    value: int | float | complex    # value of the quantity
+    format: str                     # display format for number to string conversion
+    annotation: str                 # optional annotation of Quantity
+    value: int | float | complex | np.ndarray  # value of the quantity
     unit: PhysicalUnit
 
-    def __init__(self, value: int | float | complex, unit: str | PhysicalUnit, annotation: str = ''):
+    def __init__(self, value: int | float | complex | np.ndarray, unit: str | PhysicalUnit, annotation: str = ''):
         """There are two constructor calling patterns
 
         Parameters
@@ -60,9 +118,33 @@ class PhysicalQuantity:
         except NameError:
             self.ptformatter = None
         self.value = value
+        self.format = ''
         self.annotation = annotation
         self.unit = findunit(unit)
 
+    @classmethod
+    def from_array(cls, values, unit: str | PhysicalUnit) -> PhysicalQuantity:
+        """ Create a quantity holding all values in a single numpy array
+
+        Parameters
+        ----------
+        values: array_like
+            Values, e.g. a list of numbers
+        unit: str or PhysicalUnit
+            Unit of all values
+
+        Returns
+        -------
+        PhysicalQuantity
+            Quantity with a numpy array as value
+
+        Examples
+        --------
+        >>> PhysicalQuantity.from_array([1, 2, 3], 'm')
+        [1 2 3] m
+        """
+        return cls(np.asarray(values), unit)
+
     def __dir__(self) -> list[str]:
         """List available attributes including conversion to other scaling prefixes
 
@@ -78,7 +160,7 @@ class PhysicalQuantity:
                     ulist.append(_u.name)
         return ulist
     
-    def __getattr__(self, attr) -> int | float | complex | PhysicalQuantity:
+    def __getattr__(self, attr) -> int | float | complex | np.ndarray | PhysicalQuantity:
         """ Convert to different scaling in the same unit.
             If a '_' is appended, drop unit (possibly after rescaling) and return value only.
 
@@ -112,9 +194,9 @@ class PhysicalQuantity:
         except KeyError:
             raise AttributeError(f'Unit {attr} not found')
         if dropunit is True:
-            return self.to(attrunit.name).value
+            return self.to(attrunit).value
         else:
-            return self.to(attrunit.name)
+            return self.to(attrunit)
 
     def __getitem__(self, key):
         """ Allow indexing if quantities if underlying object is array or list
@@ -133,7 +215,7 @@ class PhysicalQuantity:
         if not isinstance(value, PhysicalQuantity):
             raise AttributeError('Not a Physical Quantity')
         if isinstance(self.value, np.ndarray) or isinstance(self.value, list):
-            self.value[key] = value.to(str(self.unit)).value
+            self.value[key] = convertvalue(value.value, value.unit, self.unit)
             return self.__class__(self.value[key], self.unit)
         raise AttributeError('Not a PhysicalQuantity array or list', list)
         
@@ -216,7 +298,7 @@ class PhysicalQuantity:
         if self.ptformatter is not None and self.format == '' and isinstance(self.value, float):  # pragma: no cover
             # %precision magic only works for floats
             fmt = self.ptformatter.float_format
-            return u"%s %s" % (fmt % self.value, self.unit._repr_markdown_())
+            return u"%s %s" % (fmt % self.value, self.unit.markdown)
         if str(type(self.value)).find('sympy') > 0:
             from sympy import printing  # type: ignore
             return '${0}$ {1}'.format(printing.latex(self.value), self.unit.markdown)
@@ -249,8 +331,12 @@ class PhysicalQuantity:
         """
         if not isinstance(other, PhysicalQuantity):
             raise UnitError(f'Incompatible types {type(self)} and {type(other)}')
-        new_value = sign1 * self.value + \
-            sign2 * other.value * other.unit.conversion_factor_to(self.unit)
+        if other.unit is self.unit:
+            # units from the unit table or parsed from the same string are shared objects
+            new_value = sign1 * self.value + sign2 * other.value
+        else:
+            new_value = sign1 * self.value + \
+                sign2 * other.value * other.unit.conversion_factor_to(self.unit)
         return self.__class__(new_value, self.unit)
 
     def __add__(self, other):
@@ -409,133 +495,24 @@ class PhysicalQuantity:
             return self.__class__(np.nonzero(self.value), self.unit)
         return self.value != 0
 
-    def __gt__(self, other):
-        """ Test if quantity is greater than other
-
-        Parameters
-        ----------
-        other: PhysicalQuantity
-        
-
-        Returns
-        -------
-        bool
-            true if quantity is greater than other
-        """
-        if isinstance(other, PhysicalQuantity):
-            if self.base.unit == other.base.unit:
-                return self.base.value > other.base.value
-            else:
-                raise UnitError(f'Cannot compare unit {self.unit} with unit {other.unit}')
-        else:
-            raise UnitError(f'Cannot compare PhysicalQuantity with type {type(other)}')
-
-    def __ge__(self, other):
-        """ Test if quantity is greater or equal than other
-
-        Parameters
-        ----------
-        other: PhysicalQuantity
-            Quantity to compare against
-
-        Returns
-        -------
-        bool
-            True if quantity is greater or equal than other
-        """
-        if isinstance(other, PhysicalQuantity):
-            if self.base.unit == other.base.unit:
-                return self.base.value >= other.base.value
-            else:
-                raise UnitError(f'Cannot compare unit {self.unit} with unit {other.unit}')
-        else:
-            raise UnitError(f'Cannot compare PhysicalQuantity with type {type(other)}')
-
-    def __lt__(self, other):
-        """ Test if quantity is less than other
-
-        Parameters
-        ----------
-        other: PhysicalQuantity
-            Quantity to compare against
-
-        Returns
-        -------
-        bool
-            True if quantity is less than other
-        """
-        if isinstance(other, PhysicalQuantity):
-            if self.base.unit == other.base.unit:
-                return self.base.value < other.base.value
-            else:
-                raise UnitError(f'Cannot compare unit {self.unit} with unit {other.unit}')
-        else:
-            raise UnitError(f'Cannot compare PhysicalQuantity with type {type(other)}')
-
-    def __le__(self, other):
-        """ Test if quantity is less or equal than other
-
-        Parameters
-        ----------
-        other: PhysicalQuantity
-            Quantity to compare against
+    def __bool__(self) -> bool:
+        """ Test if quantity is not zero, for arrays if any element is not zero
 
         Returns
         -------
         bool
-            :param other: other PhysicalQuantity
-            :return: true if quantity is less or equal than other
-            :rtype: bool
-        """
-        if isinstance(other, PhysicalQuantity):
-            if self.base.unit == other.base.unit:
-                return self.base.value <= other.base.value
-            else:
-                raise UnitError(f'Cannot compare unit {self.unit} with unit {other.unit}')
-        else:
-            raise UnitError(f'Cannot compare PhysicalQuantity with type {type(other)}')
-
-    def __eq__(self, other):
-        """ Test if two quantities are equal
-
-        Parameters
-        ----------
-        other: PhysicalQuantity
-            Quantity to compare against
-
-        Returns
-        -------
-        bool
-            True if quantities are equal
+            true if quantity is not zero
         """
-        if isinstance(other, PhysicalQuantity):
-            if self.base.unit.name == other.base.unit.name:
-                return self.base.value == other.base.value
-            else:
-                raise UnitError(f'Cannot compare unit {self.unit} with unit {other.unit}')
-        else:
-            raise UnitError(f'Cannot compare PhysicalQuantity with type {type(other)}')
-
-    def __ne__(self, other):
-        """Test if two quantities are not equal
-
-        Parameters
-        ----------
-        other: PhysicalQuantity
-            Quantity to compare against
+        if isinstance(self.value, np.ndarray):
+            return bool(self.value.any())
+        return bool(self.value)
 
-        Returns
-        -------
-        bool
-            True if quantities are not equal
-        """
-        if isinstance(other, PhysicalQuantity):
-            if self.base.unit == other.base.unit:
-                return not self.base.value == other.base.value
-            else:
-                raise UnitError(f'Cannot compare unit {self.unit} with unit {other.unit}')
-        else:
-            raise UnitError(f'Cannot compare PhysicalQuantity with type {type(other)}')
+    __gt__ = _comparison(operator.gt, 'greater than')
+    __ge__ = _comparison(operator.ge, 'greater or equal than')
+    __lt__ = _comparison(operator.lt, 'less than')
+    __le__ = _comparison(operator.le, 'less or equal than')
+    __eq__ = _comparison(operator.eq, 'equal to')
+    __ne__ = _comparison(operator.ne, 'not equal to')
 
     def __format__(self, *args, **kw):
         return "{1:{0}} {2}".format(args[0], self.value, self.unit)
@@ -556,18 +533,23 @@ class PhysicalQuantity:
 
     @staticmethod
     def _round(x):
-        if np.greater(x, 0.):
-            return np.floor(x)
-        else:
-            return np.ceil(x)
+        """ Round towards zero, i.e. floor for positive and ceil for negative values """
+        return np.trunc(x)
 
     def __deepcopy__(self, memo: dict) -> PhysicalQuantity:
         """ Return a copy of the PhysicalQuantity including the value.
-            Needs deepcopy to copy the value
+            The unit is shared, only the value is copied
         """
-        new_value = copy.deepcopy(self.value)
-        new_instance = self.__class__(new_value, self.unit)
+        new_instance = self.__class__.__new__(self.__class__)
         memo[id(self)] = new_instance
+        if isinstance(self.value, np.ndarray):
+            new_instance.value = np.copy(self.value)
+        else:
+            new_instance.value = copy.deepcopy(self.value, memo)
+        new_instance.unit = self.unit
+        new_instance.format = self.format
+        new_instance.annotation = self.annotation
+        new_instance.ptformatter = self.ptformatter
         return new_instance
 
     @property
@@ -582,17 +564,14 @@ class PhysicalQuantity:
         """
         if len(self.unit.names) == 1:
             b = self.base
-            n = np.log10(abs(b.value))
+            n = np.log10(np.abs(b.value))
             # we want to be between 0..999 
             _scale = np.floor(n)
             # now search for unit
-            for i in unit_table:
-                u = unit_table[i]
-                if isinstance(u, PhysicalUnit):
-                    if u.baseunit is self.unit.baseunit:
-                        f = np.log10(u.factor) - _scale
-                        if (f > -3) and (f < 1):
-                            return self.to(i)
+            for log_factor, name in _autoscale_units(self.unit.baseunit):
+                f = log_factor - _scale
+                if (f > -3) and (f < 1):
+                    return self.to(name)
         return self
 
     def to(self, *units):
@@ -623,7 +602,11 @@ class PhysicalQuantity:
         units = list(map(findunit, units))
         if len(units) == 1:
             unit = units[0]
-            value = convertvalue(self.value, self.unit, unit)
+            if unit is self.unit and not isinstance(self.value, list):
+                # nothing to convert, only copy arrays so the result does not share data with self
+                value = self.value.copy() if isinstance(self.value, np.ndarray) else self.value
+            else:
+                value = convertvalue(self.value, self.unit, unit)
             return self.__class__(value, unit)
         else:
             units.sort()
@@ -631,7 +614,7 @@ class PhysicalQuantity:
             value = self.value
             unit = self.unit
             for i in range(len(units)-1, -1, -1):
-                value *= unit.conversion_factor_to(units[i])
+                value = value * unit.conversion_factor_to(units[i])
                 if i == 0:
                     rounded = value
                 else:
@@ -734,7 +717,7 @@ class PhysicalQuantity:
         """
         return self.__pow__(exponent)
 
-    def sin(self) -> float:
+    def sin(self) -> float | np.ndarray:
         """ Return sine of given PhysicalQuantity with angle unit
 
         Returns
@@ -746,12 +729,13 @@ class PhysicalQuantity:
         UnitError
             If quantity is not of unit angle
         """
+        # angle units are scaled versions of the base unit rad, so the factor converts to rad
         if self.unit.is_angle:
-            return np.sin(self.value * self.unit.conversion_factor_to(unit_table['rad']))
+            return np.sin(self.value * self.unit.factor)
         else:
             raise UnitError('Argument of sin must be an angle')
 
-    def cos(self) -> float:
+    def cos(self) -> float | np.ndarray:
         """ Return cosine of given PhysicalQuantity with angle unit
 
         Returns
@@ -764,10 +748,10 @@ class PhysicalQuantity:
             If quantity is not of unit angle
         """
         if self.unit.is_angle:
-            return np.cos(self.value * self.unit.conversion_factor_to(unit_table['rad']))
+            return np.cos(self.value * self.unit.factor)
         raise UnitError('Argument of cos must be an angle')
 
-    def tan(self) -> float:
+    def tan(self) -> float | np.ndarray:
         """ Return tangens of given PhysicalQuantity with angle unit
 
         Returns
@@ -780,7 +764,7 @@ class PhysicalQuantity:
             If quantity is not of unit angle
         """
         if self.unit.is_angle:
-            return np.tan(self.value * self.unit.conversion_factor_to(unit_table['rad']))
+            return np.tan(self.value * self.unit.factor)
         raise UnitError('Argument of tan must be an angle')
 
     @property
@@ -806,8 +790,11 @@ class PhysicalQuantity:
         str
             JSON string describing PhysicalQuantity
 
+        Notes
+        -----
+        Numpy array values are stored as (nested) lists.
         """
-        json_quantity = json.dumps({'PhysicalQuantity': self.to_dict})
+        json_quantity = json.dumps({'PhysicalQuantity': self.to_dict}, default=_json_default)
         return json_quantity
 
     @staticmethod
@@ -1,9 +1,14 @@
 """Transform a single line by replacing inline physical units with 'pq.<unit>'"""
 import tokenize
+from functools import lru_cache
 from tokenize import NAME, NUMBER, OP, TokenError
 from PhysicalQuantities import q
+from PhysicalQuantities.unit import _unit_table_caches
 import io
 
+# translation table deleting all characters but digits, used to quickly check for numbers in a line
+_DIGITS_ONLY = str.maketrans('', '', ''.join(c for c in map(chr, range(256)) if not c.isdigit()))
+
 
 def add_pq_prefix(token: str, prefix: str = ' pq.') -> str:
     """Add prefix 'pq.' if valid unit was found
@@ -19,16 +24,29 @@ def add_pq_prefix(token: str, prefix: str = ' pq.') -> str:
     -------
         Token with 'pq.' prefix added
     """
-    if token in q.table.keys():
+    if token in q.table:
         return prefix + token
     return token
 
 
+@lru_cache(maxsize=1024)
 def transform_line(line=''):
     """Transform a single line by replacing inline physical units with 'pq.<unit>',
        i.e. '1m' -> '1* pq.m'
+
+    Notes
+    -----
+    Results are cached, as the same lines get transformed over and over again in an IPython session.
+    The cache is cleared together with the other unit_table caches, when new units are added or `q.update()` is called.
     """
-    string_io = io.StringIO(line)
+    if not line.translate(_DIGITS_ONLY):
+        # units are only inserted after a number
+        return line
+    # tokenize without the indentation and restore it unchanged afterwards,
+    # untokenize would replace it with a single space
+    body = line.lstrip(' \t')
+    indent = line[:len(line) - len(body)]
+    string_io = io.StringIO(body)
     g = tokenize.generate_tokens(string_io.readline)
     tokenlist = []
     result = []
@@ -68,5 +86,8 @@ def transform_line(line=''):
         else:
             result.append(tokenlist[i])
             i += 1
-    line = tokenize.untokenize(result)
+    line = indent + tokenize.untokenize(result)
     return line
+
+
+_unit_table_caches.append(transform_line.cache_clear)
@@ -6,8 +6,8 @@ from __future__ import annotations
 from __future__ import annotations
 import copy
 import json
-from functools import reduce, lru_cache
-from typing import Dict
+from functools import cached_property, lru_cache
+from typing import Callable, Dict
 from fractions import Fraction
 
 import numpy as np
@@ -19,6 +19,19 @@ class UnitError(ValueError):
     pass
 
 
+def _pack_powers(powers: list[int]) -> int:
+    """Pack the base unit powers into a single integer, using 32 bits per power
+
+    Units with equal dimensions have equal signatures, so a dimension check becomes one integer comparison.
+    Powers are offset by 2**31, so negative powers do not borrow from their neighbours.
+    """
+    return sum((int(p) + 0x80000000) << (32 * i) for i, p in enumerate(powers))
+
+
+# signature of plane angles, i.e. units with powers of rad only
+_ANGLE_SIGNATURE = _pack_powers([0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0])
+
+
 class PhysicalUnit:
     prefixed: bool = False
     """Physical unit.
@@ -92,6 +105,7 @@ class PhysicalUnit:
         if len(base_names) != len(powers):
             raise ValueError('Invalid number of powers given for existing base_names')
         self.powers = powers
+        self._signature = _pack_powers(powers)
         self.unece_code = unece_code
 
     def set_name(self, name):
@@ -104,8 +118,11 @@ class PhysicalUnit:
         """
         self.names = FractionalDict()
         self.names[name] = 1
+        # drop cached representations of the previous name
+        for attr in ('name', '_str_name', '_markdown_name', 'markdown'):
+            self.__dict__.pop(attr, None)
 
-    @property
+    @cached_property
     def name(self) -> str:
         """ Return name of unit
 
@@ -133,7 +150,7 @@ class PhysicalUnit:
             num = num[1:]
         return num + denom
 
-    @property
+    @cached_property
     def _markdown_name(self) -> str:
         """ Return name of unit as markdown string
 
@@ -196,7 +213,7 @@ class PhysicalUnit:
         bool
             True if dimensionless
         """
-        return not reduce(lambda a, b: a or b, self.powers)
+        return not any(self.powers)
 
     @property
     def is_angle(self) -> bool:
@@ -207,7 +224,7 @@ class PhysicalUnit:
         bool
             True if unit is an angle
         """
-        return self.powers[7] == 1 and reduce(lambda a, b: a + b, self.powers) == 1
+        return self._signature == _ANGLE_SIGNATURE
 
     def __str__(self) -> str:
         """ Return string text representation of unit
@@ -217,8 +234,12 @@ class PhysicalUnit:
         str
             Text representation of unit
         """
-        name = self.name.strip().replace('**', u'^')
-        return name
+        return self._str_name
+
+    @cached_property
+    def _str_name(self) -> str:
+        """ Name of unit with '^' as power operator, as used by `__str__` """
+        return self.name.strip().replace('**', u'^')
 
     def __repr__(self) -> str:
         return '<PhysicalUnit ' + self.name + '>'
@@ -231,9 +252,7 @@ class PhysicalUnit:
         str
             Unit as LaTeX string
         """
-        unit = self._markdown_name
-        s = '$%s$' % unit
-        return s
+        return self.markdown
 
     def _repr_latex_(self) -> str:
         """ Return LaTeX representation for IPython notebook
@@ -247,7 +266,7 @@ class PhysicalUnit:
         s = '%s' % unit
         return s
 
-    @property
+    @cached_property
     def markdown(self) -> str:
         """ Return unit as a markdown formatted string
 
@@ -256,7 +275,7 @@ class PhysicalUnit:
         str
             Unit as LaTeX string
         """
-        return self._repr_markdown_()
+        return '$%s$' % self._markdown_name
 
     @property
     def latex(self) -> str:
@@ -282,7 +301,7 @@ class PhysicalUnit:
         bool
             True, if unit is greater than other unit
         """
-        if isphysicalunit(other) and self.powers == other.powers:
+        if isphysicalunit(other) and self._signature == other._signature:
             return self.factor > other.factor
         raise UnitError('Cannot compare different dimensions %s and %s' % (self, other))
 
@@ -299,7 +318,7 @@ class PhysicalUnit:
         bool
             True, if unit is greater or equal than other unit
         """
-        if isphysicalunit(other) and self.powers == other.powers:
+        if isphysicalunit(other) and self._signature == other._signature:
             return self.factor >= other.factor
         raise UnitError('Cannot compare different dimensions %s and %s' % (self, other))
 
@@ -316,7 +335,7 @@ class PhysicalUnit:
         bool
             True, if unit is less than other unit
         """
-        if isphysicalunit(other) and self.powers == other.powers:
+        if isphysicalunit(other) and self._signature == other._signature:
             return self.factor < other.factor
         raise UnitError('Cannot compare different dimensions %s and %s' % (self, other))
 
@@ -333,7 +352,7 @@ class PhysicalUnit:
         bool
             True, if unit is less or equal than other unit
         """
-        if isphysicalunit(other) and self.powers == other.powers:
+        if isphysicalunit(other) and self._signature == other._signature:
             return self.factor <= other.factor
         raise UnitError('Cannot compare different dimensions %s and %s' % (self, other))
 
@@ -350,7 +369,9 @@ class PhysicalUnit:
         bool
             True, if unit is equal than other unit
         """
-        if isphysicalunit(other) and self.powers == other.powers:
+        if self is other:
+            return True
+        if isphysicalunit(other) and self._signature == other._signature:
             return self.factor == other.factor
         raise UnitError('Cannot compare different dimensions %s and %s' % (self, other))
 
@@ -379,7 +400,7 @@ class PhysicalUnit:
         if isphysicalunit(other):
             return PhysicalUnit(self.names + other.names,
                                 self.factor * other.factor,
-                                list(map(lambda a, b: a + b, self.powers, other.powers)))
+                                [a + b for a, b in zip(self.powers, other.powers)])
         elif isinstance(other, PhysicalQuantity):
             other = other.unit
             newpowers = [a + b for a, b in zip(other.powers, self.powers)]
@@ -415,7 +436,7 @@ class PhysicalUnit:
         if isphysicalunit(other):
             return PhysicalUnit(self.names - other.names,
                                 self.factor / other.factor,
-                                list(map(lambda a, b: a - b, self.powers, other.powers)))
+                                [a - b for a, b in zip(self.powers, other.powers)])
         elif isinstance(other, PhysicalQuantity):
             other = other.unit
             newpowers = [a - b for a, b in zip(other.powers, self.powers)]
@@ -431,11 +452,11 @@ class PhysicalUnit:
         if isphysicalunit(other):
             return PhysicalUnit(other.names - self.names,
                                 other.factor / self.factor,
-                                list(map(lambda a, b: a - b, other.powers, self.powers)))
+                                [a - b for a, b in zip(other.powers, self.powers)])
         else:
             return PhysicalUnit(FractionalDict({str(other): 1}) - self.names,
                                 other / self.factor,
-                                list(map(lambda x: -x, self.powers)))
+                                [-x for x in self.powers])
 
     def __floordiv__(self, other):
         """ Divide two units
@@ -461,7 +482,7 @@ class PhysicalUnit:
         if isphysicalunit(other):
             return PhysicalUnit(self.names - other.names,
                                 self.factor // other.factor,
-                                list(map(lambda a, b: a - b, self.powers, other.powers)))
+                                [a - b for a, b in zip(self.powers, other.powers)])
         else:
             # TODO: add test
             return PhysicalUnit(self.names + FractionalDict({str(other): -1}),
@@ -492,10 +513,9 @@ class PhysicalUnit:
         if self.offset != 0:
             raise UnitError('Cannot exponentiate units %s and %s with non-zero offset' % (self, exponent))
         if isinstance(exponent, int):
-            y = lambda x, _p=exponent: x * _p
-            p = list(map(y, self.powers))
+            p = [x * exponent for x in self.powers]
             f = pow(self.factor, exponent)
-            names = FractionalDict((k, self.names[k] * Fraction(exponent, 1)) for k in self.names)
+            names = FractionalDict({k: v * Fraction(exponent, 1) for k, v in self.names.items()})
             return PhysicalUnit(names, f, p)
         elif isinstance(exponent, float):
             inv_exp = 1. / exponent
@@ -514,6 +534,17 @@ class PhysicalUnit:
                     raise UnitError('Illegal exponent %f' % exponent)
         raise UnitError('Only integer and inverse integer exponents allowed')
 
+    def __copy__(self) -> PhysicalUnit:
+        """ Return a shallow copy of the unit
+
+        A unit that is its own base unit is also the base unit of its copy.
+        """
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        if self.baseunit is self:
+            new.baseunit = new
+        return new
+
     def __hash__(self):
         """Custom hash function"""
         return hash((self.factor, self.offset, str(self.powers)))
@@ -537,7 +568,9 @@ class PhysicalUnit:
         >>> q.km.unit.conversion_factor_to(q.m.unit)
         1000.0
         """
-        if self.powers != other.powers:
+        if self is other:
+            return 1.0
+        if self._signature != other._signature:
             raise UnitError('Incompatible units')
         if self.offset != other.offset and self.factor != other.factor:
             raise UnitError(('Unit conversion (%s to %s) cannot be expressed ' +
@@ -564,7 +597,9 @@ class PhysicalUnit:
         >>> q.km.unit.conversion_tuple_to(q.m.unit)
         (1000.0, 0.0)
         """
-        if self.powers != other.powers:
+        if self is other:
+            return 1.0, 0.0
+        if self._signature != other._signature:
             raise UnitError(f'Incompatible unit for conversion from {self} to {other}')
 
         # let (s1,d1) be the conversion tuple from 'self' to base units
@@ -620,12 +655,15 @@ class PhysicalUnit:
 
         Notes
         -----
-        Give unit and iterate over base units
+        Give unit and iterate over base units. The JSON string is cached, it is created again if name,
+        verbose name, factor or offset of the unit were changed.
 
         """
-
-        json_unit = json.dumps({'PhysicalUnit': self.to_dict})
-        return json_unit
+        state = (self.name, self.verbosename, self.factor, self.offset)
+        cached = getattr(self, '_json', None)
+        if cached is None or cached[0] != state:
+            cached = self._json = (state, json.dumps({'PhysicalUnit': self.to_dict}))
+        return cached[1]
 
     @staticmethod
     def from_dict(unit_dict) -> PhysicalUnit:
@@ -668,6 +706,58 @@ class PhysicalUnit:
         return PhysicalUnit.from_dict(unit_dict['PhysicalUnit'])
 
 
+# functions clearing the caches derived from the unit_table in other modules, called together with the unit name cache
+_unit_table_caches: list[Callable[[], None]] = []
+
+
+def _clear_unit_table_caches():
+    """ Clear all caches derived from the unit_table, called when units are added """
+    _findunit_by_name.cache_clear()
+    for clear_cache in _unit_table_caches:
+        clear_cache()
+
+
+@lru_cache(maxsize=2048)
+def _findunit_by_name(unitname: str) -> PhysicalUnit:
+    """ Parse unit name and return PhysicalUnit
+
+    Results of the most recently used names are cached, the cache is cleared when new units are added to the
+    unit_table.
+
+    Parameters
+    ----------
+    unitname: str
+        Normalized name of the unit, e.g. 'mm' or 'm/s**2'
+
+    Returns
+    -------
+    PhysicalUnit
+        Unit
+
+    Raises
+    ------
+    UnitError
+        If the name is not a valid unit.
+    """
+    if unitname == '':
+        raise UnitError('Empty unit name is not valid')
+    name = unitname
+    if name.startswith('1/'):
+        name = '(' + name[2:] + ')**-1'
+    try:
+        unit = eval(name, unit_table)
+    except NameError:
+        raise UnitError('Invalid or unknown unit %s' % name)
+    for cruft in ['__builtins__', '__args__']:
+        try:
+            del unit_table[cruft]
+        except KeyError:
+            pass
+    if not isphysicalunit(unit):
+        raise UnitError(f'{str(unit)} is not a unit')
+    return unit
+
+
 def addunit(unit):
     """ Add new PhysicalUnit entry to the unit_table
 
@@ -685,6 +775,7 @@ def addunit(unit):
     if unit.name in unit_table:
         raise KeyError(f'Unit {unit.name} already defined')
     unit_table[unit.name] = unit
+    _clear_unit_table_caches()
 
 
 unit_table: Dict[str, PhysicalUnit] = {}
@@ -784,12 +875,12 @@ def add_composite_unit(name, factor, units, offset=0, verbosename='', prefixed=F
     newunit.factor *= factor
     newunit.offset += offset
     unit_table[name] = newunit
+    _clear_unit_table_caches()
 
     return name
 
 
 # Helper functions
-@lru_cache(maxsize=None)
 def findunit(unitname):
     """ Return PhysicalUnit class if given parameter is a valid unit
 
@@ -808,31 +899,22 @@ def findunit(unitname):
     UnitError
         If the input is invalid.
 
+    Notes
+    -----
+    PhysicalUnit objects are returned unchanged, they are not replaced by an equal unit from the unit_table.
+    The product of V and A therefore keeps the name V*A instead of W, use `to('W')` to convert it.
+
     Examples
     --------
     >>> findunit('mm')
      <PhysicalUnit mm>
     """
     if isinstance(unitname, str):
-        if unitname == '':
-            raise UnitError('Empty unit name is not valid')
-        name = unitname.strip().replace('^', '**')
-        if name.startswith('1/'):
-            name = '(' + name[2:] + ')**-1'
-        try:
-            unit = eval(name, unit_table)
-        except NameError:
-            raise UnitError('Invalid or unknown unit %s' % name)
-        for cruft in ['__builtins__', '__args__']:
-            try:
-                del unit_table[cruft]
-            except KeyError:
-                pass
-    else:
-        unit = unitname
-    if not isphysicalunit(unit):
-        raise UnitError(f'{str(unit)} is not a unit')
-    return unit
+        # normalize the name, so that e.g. 'm^2' and 'm**2' share the same cached unit
+        return _findunit_by_name(unitname.strip().replace('^', '**'))
+    if not isphysicalunit(unitname):
+        raise UnitError(f'{str(unitname)} is not a unit')
+    return unitname
 
 
 def convertvalue(value, src_unit, target_unit):
@@ -861,6 +943,12 @@ def convertvalue(value, src_unit, target_unit):
     (factor, offset) = src_unit.conversion_tuple_to(target_unit)
     if isinstance(value, list):
         raise UnitError('Cannot convert units for a list')
+    if offset == 0:
+        return value * factor
+    if isinstance(value, np.ndarray) and value.ndim > 0:
+        # scale the shifted array in place, so only one new array is allocated
+        new_value = np.add(value, offset)
+        return np.multiply(new_value, factor, out=new_value)
     return (value + offset) * factor
 
 
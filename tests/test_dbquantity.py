@@ -409,6 +409,21 @@ def test_sub_db_3():
         g1 - g2
 
 
+def test_add_db_np():
+    g1 = np.zeros(3) * dBQuantity(0, 'dBm')
+    g2 = np.array([0., 10., 20.]) * dBQuantity(1, 'dBm')
+    g = g1 + g2
+    assert g.unit.name == 'dBm'
+    assert_almost_equal(g.value, 10 * np.log10(1 + 10 ** (g2.value / 10)))
+
+
+def test_sub_db_np():
+    g1 = np.array([1., 2.]) * dBQuantity(1, 'dBm')
+    g2 = np.zeros(2) * dBQuantity(0, 'dBm')
+    assert_almost_equal((g1 - g2).value, 10 * np.log10(10 ** (g1.value / 10) - 1))
+    assert_almost_equal((g1 - g2)[0].value, (dBQuantity(1, 'dBm') - dBQuantity(0, 'dBm')).value)
+
+
 def test_dB10_0():
     a = dB10(PhysicalQuantity(10, 'V'))
     assert a.value == 10
@@ -650,6 +665,14 @@ def test_deepcopy():
     assert a is not b
 
 
+def test_deepcopy_np():
+    a = np.array([1., 2.]) * dBQuantity(1, 'dBm')
+    b = copy.deepcopy(a)
+    assert b.unit is a.unit
+    b[0] = dBQuantity(0, 'dBm')
+    assert a[0].value == 1.
+
+
 def test_neg():
     a = dBQuantity(1, 'dBm')
     b = dBQuantity(-1, 'dBm')
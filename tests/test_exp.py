@@ -19,16 +19,20 @@ def test_exp_1():
 def test_exp_2():
     """ test square root """
     a = pq.Q(1.0,'m')**2
-    assert str(a**0.5) == '1.0 V'
+    b = a**0.5
+    assert b.value == 1.0
+    assert b.unit.powers == [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 
 
 def test_exp_3():
     """ exponentials in numerator and denominator """
     a = pq.Q(1.0,'m**2/s**4')
-    assert a == '1.0 m^2/s^4'
+    assert a.value == 1.0
+    assert a.unit.powers == [2, 0, -4, 0, 0, 0, 0, 0, 0, 0, 0]
 
 
-def text_exp_4():
+def test_exp_4():
     """ test square root """
-    a = pq.Q(4.0,'m**2/s**4')
-    assert a == '2.0 m/s^2.0'
+    a = pq.Q(4.0,'m**2/s**4')**0.5
+    assert a.value == 2.0
+    assert a.unit.powers == [1, 0, -2, 0, 0, 0, 0, 0, 0, 0, 0]
@@ -83,3 +83,12 @@ def test_rmul():
     b = Fraction(2)*a
     assert b['a'] == 2*3
     assert b['b'] == 2*2
+
+
+def test_add_order():
+    """ keys of the left operand come first """
+    a = FractionalDict({'m': 1, 'kg': 1})
+    b = FractionalDict({'s': -2, 'm': 1})
+    c = a+b
+    assert list(c.keys()) == ['m', 'kg', 's']
+    assert c == {'m': 2, 'kg': 1, 's': -2}
@@ -30,3 +30,8 @@ def test_quantity_dir():
     d = pq.q.__dir__()
     assert len(d) > 40
 
+
+
+def test_quantity_getattr_table():
+    assert pq.q.mm is pq.q['mm']
+    assert callable(pq.q.update)
@@ -1,6 +1,7 @@
 
-from PhysicalQuantities import unit_table
+from PhysicalQuantities import q, unit_table
 from PhysicalQuantities.ipython import transform
+from PhysicalQuantities.transform import transform_line
 
 
 def test_empty():
@@ -29,3 +30,20 @@ def test_comment():
     line = [' """ ', 'a=1V', ' """ ']
     ret = transform(line)
     assert ret[1] == "a=1V"
+
+
+def test_indented_cell():
+    """ Multi line cell with tab indentation """
+    lines = ['def f():\n', '\tx = 2\n', '\ty = 3mm\n', '\treturn x\n']
+    ret = transform(lines)
+    assert ret[1] == '\tx = 2\n'
+    assert ret[2].startswith('\ty =')
+    compile(''.join(ret), '<cell>', 'exec')
+
+
+def test_transform_cache_cleared():
+    """ Transformed lines are cleared with the other unit_table caches """
+    transform_line('a = 1m')
+    assert transform_line.cache_info().currsize > 0
+    q.update()
+    assert transform_line.cache_info().currsize == 0
@@ -50,3 +50,11 @@ def test_array_3():
     """ index range """
     a = np.array([1,2,3]) * pq.Q(1,'m')
     assert str(a[0:2]) == '[1 2] m'
+
+
+def test_from_array():
+    """ wrap list as numpy array """
+    a = pq.Q.from_array([1, 2, 3], 'm')
+    assert isinstance(a.value, np.ndarray)
+    assert str(a) == '[1 2 3] m'
+    assert str(a[1]) == '2 m'
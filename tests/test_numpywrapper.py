@@ -77,6 +77,13 @@ def test_linspace_6():
     assert_almost_equal(a.value, b)
 
 
+def test_linspace_7():
+    a = nw.linspace(PhysicalQuantity(1, 'mm'), PhysicalQuantity(1, 'cm'), 10)
+    b = np.linspace(1, 10, 10)
+    assert a.unit.name == 'mm'
+    assert_almost_equal(a.value, b)
+
+
 def test_tophysicalquantity_1():
     # conversion of PQ array elements to PQ array
     a = [ PhysicalQuantity(1, 'mm'), PhysicalQuantity(2, 'm'), PhysicalQuantity(3, 'mm')]
@@ -134,6 +141,33 @@ def test_tophysicalquantity_8():
     assert a[0].unit == b.unit
 
 
+def test_tophysicalquantity_9():
+    # elements without unit are taken to be in the given unit
+    a = [PhysicalQuantity(1.5, 'mm'), 2., PhysicalQuantity(0.003, 'm')]
+    b = nw.tophysicalquantity(a, 'mm')
+    assert_almost_equal(b.value, np.array([1.5, 2., 3.]))
+    assert b.unit == PhysicalQuantity(1, 'mm').unit
+
+
+def test_tophysicalquantity_10():
+    # values are converted before they are cast to the type of the first element
+    a = [PhysicalQuantity(1, 'mm'), PhysicalQuantity(2.5, 'm')]
+    b = nw.tophysicalquantity(a)
+    assert_almost_equal(b.value, np.array([1, 2500]))
+    assert b.unit == PhysicalQuantity(1, 'mm').unit
+
+
+def test_tophysicalquantity_11():
+    # each array valued element is converted with its own unit
+    a = [PhysicalQuantity(np.array([1, 2]), 'm'), PhysicalQuantity(np.array([3, 4]), 'km')]
+    b = nw.tophysicalquantity(a)
+    assert_almost_equal(b.value, np.array([[1, 2], [3000, 4000]]))
+    assert b.unit == PhysicalQuantity(1, 'm').unit
+    a = [PhysicalQuantity(np.array([1., 2., 3.]), 'm'), PhysicalQuantity(np.array([3., 4., 5.]), 'km')]
+    b = nw.tophysicalquantity(a)
+    assert_almost_equal(b.value, np.array([[1, 2, 3], [3000, 4000, 5000]]))
+
+
 def test_argsort_1():
     x = np.array([3, 1, 2])
     y = np.argsort(x)
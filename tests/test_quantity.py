@@ -1,5 +1,6 @@
 import copy
 import json
+import math
 import operator
 
 import numpy as np
@@ -109,6 +110,14 @@ def test_setitem_3():
         a[1] = PhysicalQuantity(5, 'mm')
 
 
+def test_setitem_4():
+    a = np.array([1., 2., 3.]) * PhysicalQuantity(1, 'mm')
+    a[1] = PhysicalQuantity(1, 'm')
+    assert a.value[1] == 1000
+    with raises(UnitError):
+        a[0] = PhysicalQuantity(1, 's')
+
+
 def test_len():
     a = [1, 2, 3] * PhysicalQuantity(1, 'mm')
     assert len(a) == 3
@@ -140,6 +149,14 @@ def test_sum_1():
     assert a+b == PhysicalQuantity(3, 'mm')
 
 
+def test_sum_3():
+    """ same unit, value type is kept """
+    a = PhysicalQuantity(1, 'mm')
+    b = PhysicalQuantity(2, 'mm')
+    assert str(a + b) == '3 mm'
+    assert str(b - a) == '1 mm'
+
+
 def test_sum_2():
     a = PhysicalQuantity(1, 'm')
     b = PhysicalQuantity(2, 's')
@@ -165,6 +182,14 @@ def test_mul_1():
     assert a*b == 6
 
 
+def test_mul_unit_name():
+    # products keep the names of their factors, they are not replaced by an equal named unit
+    assert str(PhysicalQuantity(2, 'V') * PhysicalQuantity(3, 'A')) == '6 V*A'
+    assert str(PhysicalQuantity(2, 'N') * PhysicalQuantity(3, 'm')) == '6 N*m'
+    assert str(PhysicalQuantity(2, 'A') * PhysicalQuantity(3, 's')) == '6 A*s'
+    assert (PhysicalQuantity(2, 'V') * PhysicalQuantity(3, 'A')).to('W') == PhysicalQuantity(6, 'W')
+
+
 def test_div():
     a = PhysicalQuantity(3, 'mm**2')
     b = PhysicalQuantity(4, 'mm')
@@ -198,6 +223,22 @@ def test_eq_prefixed():
     assert not a == b
 
 
+def test_eq_np():
+    a = PhysicalQuantity(np.array([1, 2]), 'mm')
+    b = PhysicalQuantity(np.array([1, 3]), 'mm')
+    assert np.array_equal(a == b, [True, False])
+    assert np.array_equal(a < b, [False, True])
+
+
+def test_eq_mixed_units():
+    assert PhysicalQuantity(1, 'nm') == PhysicalQuantity(1e-9, 'm')
+    a = PhysicalQuantity(np.array([1, 2]), 'mm')
+    b = PhysicalQuantity(np.array([1e-3, 1e-3]), 'm')
+    assert np.array_equal(a != b, [False, True])
+    with raises(UnitError):
+        assert a == PhysicalQuantity(1, 's')
+
+
 def test_ne_1():
     a = PhysicalQuantity(1, 'm')
     b = PhysicalQuantity(2, 'm')
@@ -309,6 +350,20 @@ def test_to_1():
     assert a.to('m/s') == a
 
 
+def test_to_same_unit():
+    a = PhysicalQuantity(2, 'mm')
+    b = a.to('mm')
+    assert b is not a
+    assert str(b) == '2 mm'
+    c = PhysicalQuantity(np.array([1, 2]), 'mm')
+    d = c.to('mm')
+    d.value[0] = 3
+    assert c.value[0] == 1
+    # lists cannot be converted, not even to their own unit
+    with raises(UnitError):
+        PhysicalQuantity([1, 2], 'mm').to('mm')
+
+
 def test_to_2():
     a = PhysicalQuantity(5000, 's')
     _tuple = a.to('h', 'min', 's')
@@ -326,6 +381,16 @@ def test_to_3():
     assert_almost_equal(_tuple[2].value, -20.)
 
 
+def test_to_4():
+    """conversion of arrays to several units leaves the source unchanged"""
+    a = PhysicalQuantity(np.array([1.5, 2.25]), 'm')
+    m, mm = a.to('m', 'mm')
+    assert_almost_equal(m.value, np.array([1., 2.]))
+    assert_almost_equal(mm.value, np.array([500., 250.]))
+    assert_almost_equal(a.value, np.array([1.5, 2.25]))
+    assert a.unit == PhysicalQuantity(1, 'm').unit
+
+
 def test_base_1():
     a = PhysicalQuantity(1, 'V')
     b = PhysicalQuantity(1, 'kg*m^2/A/s^3')
@@ -394,6 +459,17 @@ def test_autoscale_1():
     assert str(a.km) == str(b)
 
 
+def test_autoscale_cache():
+    """ Only base units from the unit_table are cached for autoscaling """
+    from PhysicalQuantities.quantity import _autoscale_cache
+    PhysicalQuantity(1e-3, 'm').autoscale
+    assert 'm' in _autoscale_cache
+    size = len(_autoscale_cache)
+    for i in range(10):
+        (PhysicalQuantity(1e-3, 'm') * PhysicalQuantity(i, 'kg')).autoscale
+    assert len(_autoscale_cache) == size
+
+
 def test_format():
     a = PhysicalQuantity(1.123123, 'm')
     assert str(a) == '1.123123 m'
@@ -401,6 +477,13 @@ def test_format():
     assert str(a) == '1.123 m'
 
 
+def test_slots():
+    a = PhysicalQuantity(1, 'm')
+    assert not hasattr(a, '__dict__')
+    with raises(AttributeError):
+        a.foo = 1
+
+
 def test_round():
     a = PhysicalQuantity(1.123123, 'm')
     b = round(a)
@@ -465,6 +548,13 @@ def test_nonzero_np():
     assert np.any(r.value == np.array([0, 2]))
 
 
+def test_bool():
+    assert PhysicalQuantity(4, 'm')
+    assert not PhysicalQuantity(0, 'm')
+    assert np.array([0, 1]) * PhysicalQuantity(1, 'm')
+    assert not np.zeros(3) * PhysicalQuantity(1, 'm')
+
+
 def test_is_angle():
     a = PhysicalQuantity(1, 'm')
     b = PhysicalQuantity(1, 'deg')
@@ -472,6 +562,8 @@ def test_is_angle():
     assert a.unit.is_angle is False
     assert b.unit.is_angle is True
     assert c.unit.is_angle is True
+    d = PhysicalQuantity(1, 'rad*m/s')
+    assert d.unit.is_angle is False
 
 
 def test_markdown():
@@ -486,8 +578,8 @@ def test_name():
 
 def test_deg():
     a = PhysicalQuantity(30, 'deg')
-    assert np.sin(a) == np.sin(30/180*np.pi)
-    assert np.cos(a) == np.cos(30/180*np.pi)
+    assert np.sin(a) == math.sin(math.radians(30))
+    assert np.cos(a) == math.cos(math.radians(30))
 
 
 def test_sin():
@@ -573,6 +665,13 @@ def test_round_1():
     assert np.any(a.__round__() == b)
 
 
+def test_comparison_names():
+    for name in ['__gt__', '__ge__', '__lt__', '__le__', '__eq__', '__ne__']:
+        method = getattr(PhysicalQuantity, name)
+        assert method.__name__ == name
+        assert method.__qualname__ == 'PhysicalQuantity.' + name
+
+
 def test_to_dict():
     a = PhysicalQuantity(1, 'm')
     d = a.to_dict
@@ -592,6 +691,14 @@ def test_to_json():
     assert 'value' in d.keys()
 
 
+def test_to_json_np():
+    a = PhysicalQuantity(np.array([1, 2]), 'm')
+    _q = json.loads(a.to_json)
+    assert _q['PhysicalQuantity']['value'] == [1, 2]
+    b = PhysicalQuantity(np.float64(1.5), 'm')
+    assert json.loads(b.to_json)['PhysicalQuantity']['value'] == 1.5
+
+
 def test_from_json():
     a = PhysicalQuantity(1, 'm')
     j = a.to_json
@@ -604,3 +711,13 @@ def test_deepcopy():
     b = copy.deepcopy(a)
     assert a == b
     assert a is not b
+
+
+def test_deepcopy_2():
+    a = PhysicalQuantity(np.array([1., 2.]), 'm')
+    a.format = '.1f'
+    b = copy.deepcopy(a)
+    assert b.unit is a.unit
+    assert b.format == '.1f'
+    b.value[0] = 3
+    assert a.value[0] == 1
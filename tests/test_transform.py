@@ -13,6 +13,13 @@ def test_simple():
     assert line == ret
 
 
+def test_no_number():
+    """ No number, line is returned unchanged """
+    line = '\tb = a.mm'
+    ret = transform_line(line)
+    assert ret == line
+
+
 def test_1():
     """ Simple unit """
     line = '1V'
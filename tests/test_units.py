@@ -1,14 +1,32 @@
+import copy
 import json
+import operator
 
 import numpy as np
+import pytest
 from pytest import raises
-from PhysicalQuantities import PhysicalQuantity, units_html_list, units_list
+from PhysicalQuantities import PhysicalQuantity, unit_table, units_html_list, units_list
 from PhysicalQuantities.unit import (
-    PhysicalUnit, UnitError, add_composite_unit, addunit, convertvalue,
-    findunit, isphysicalunit,
+    PhysicalUnit, UnitError, _clear_unit_table_caches, add_composite_unit,
+    addunit, convertvalue, findunit, isphysicalunit,
 )
 
 
+@pytest.fixture(scope='module')
+def m_unit():
+    return PhysicalQuantity(1, 'm').unit
+
+
+@pytest.fixture(scope='module')
+def mm_unit():
+    return PhysicalQuantity(1, 'mm').unit
+
+
+@pytest.fixture(scope='module')
+def s_unit():
+    return PhysicalQuantity(1, 's').unit
+
+
 def test_addunit_1():
     addunit(PhysicalUnit('degC', 1., [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0], offset=273.15,
             url='https://en.wikipedia.org/wiki/Celsius', verbosename='degrees Celsius'))
@@ -62,10 +80,9 @@ def test_add_composite_unit_6():
         add_composite_unit('test2', 1, '/m')
 
 
-def test_findunit_1():
+def test_findunit_1(mm_unit):
     a = findunit('mm')
-    b = PhysicalQuantity(1, 'mm').unit
-    assert(a == b)
+    assert(a == mm_unit)
 
 
 def test_findunit_2():
@@ -83,11 +100,30 @@ def test_findunit_4():
         findunit('')
 
 
-def test_convertvalue():
-    a = PhysicalQuantity(1, 'm').unit
-    b = PhysicalQuantity(1, 'mm').unit
+def test_findunit_5(m_unit):
+    assert findunit(m_unit) is m_unit
+    assert findunit('m') is m_unit
+
+
+def test_findunit_6():
+    a = findunit('m**2')
+    assert findunit('m^2') is a
+    assert findunit(' m**2 ') is a
+    assert a == a
     with raises(UnitError):
-        convertvalue([1], a, b)
+        findunit('  ')
+
+
+def test_convertvalue(m_unit, mm_unit):
+    with raises(UnitError):
+        convertvalue([1], m_unit, mm_unit)
+
+
+def test_convertvalue_np(m_unit, mm_unit):
+    value = np.array([1, 2])
+    assert np.array_equal(convertvalue(value, m_unit, mm_unit), [1000., 2000.])
+    assert np.array_equal(value, [1, 2])
+    assert convertvalue(np.array(2), m_unit, mm_unit) == 2000
 
 
 def test_unit_division_1():
@@ -96,26 +132,34 @@ def test_unit_division_1():
     assert type(a/b) == float
 
 
-def test_unit_division_2():
-    add_composite_unit('offsm', 1, 'm')
-    a = PhysicalQuantity(1, 'offsm')
-    b = PhysicalQuantity(1, 'm')
-    a.unit.offset = 1
+def test_unit_division_2(m_unit):
+    u = copy.copy(m_unit)
+    u.offset = 1
+    a = PhysicalQuantity(1, u)
+    b = PhysicalQuantity(1, m_unit)
     with raises(UnitError):
         a/b
 
 
 def test_unit_multiplication_1():
+    a = PhysicalQuantity(1, 'mm')
+    b = PhysicalQuantity(1, 'cm')
+    c = a*b
+    assert c.unit.powers == PhysicalQuantity(1, 'm^2').unit.powers
+    assert c.unit.factor == pytest.approx(1e-5)
+
+
+def test_unit_multiplication_base():
     a = PhysicalQuantity(1, 'mm')
     b = PhysicalQuantity(1, 'cm')
     assert str((a*b).base.unit) == "m^2"
 
 
-def test_unit_multiplication_2():
-    add_composite_unit('offsma', 1, 'm')
-    a = PhysicalQuantity(1, 'offsma')
-    b = PhysicalQuantity(1, 'm')
-    a.unit.offset = 1
+def test_unit_multiplication_2(m_unit):
+    u = copy.copy(m_unit)
+    u.offset = 1
+    a = PhysicalQuantity(1, u)
+    b = PhysicalQuantity(1, m_unit)
     with raises(UnitError):
         a*b
 
@@ -136,15 +180,47 @@ def test_unit_multiplication_4():
 def test_unit_inversion():
     a = PhysicalQuantity(1, 'm')
     b = 1/a
-    assert np.any(np.array(b.unit.powers) - np.array(a.unit.powers) == 0)
+    assert b.unit.powers == [-p for p in a.unit.powers]
+
+
+def test_copy(m_unit):
+    u = copy.copy(m_unit)
+    u.offset = 1
+    assert u is not m_unit
+    assert u.baseunit is u
+    assert m_unit.offset == 0
+    assert u.name == 'm'
+
+
+def test_unit_inversion_2(m_unit):
+    inv = m_unit ** -1
+    assert inv.powers == [-p for p in m_unit.powers]
+    assert inv.factor == 1
 
 
 def test_aggregation():
     a = PhysicalQuantity(1, 'm')
     b = PhysicalQuantity(1, 's')
     c = a*b
-    p = [a.unit.powers[i] + b.unit.powers[i] for i in range(len(a.unit.powers))]
-    assert p == c.unit.powers
+    p = np.add(a.unit.powers, b.unit.powers)
+    assert p.tolist() == c.unit.powers
+
+
+def test_signature():
+    a = PhysicalQuantity(1, 'm')
+    b = PhysicalQuantity(1, 'mm')
+    c = PhysicalQuantity(1, 's')
+    assert a.unit._signature == b.unit._signature
+    assert a.unit._signature != c.unit._signature
+    assert (1/c).unit._signature != c.unit._signature
+    assert (a/c).unit._signature == PhysicalQuantity(1, 'm/s').unit._signature
+
+
+def test_signature_large_powers(m_unit):
+    # large powers must not wrap around into other powers
+    assert (m_unit**128)._signature != (m_unit**-128)._signature
+    assert (m_unit**256)._signature != (m_unit**0)._signature
+    assert (m_unit**-1)._signature != PhysicalQuantity(1, 'm**255/kg').unit._signature
 
 
 def test_conversion_factor_to():
@@ -153,12 +229,22 @@ def test_conversion_factor_to():
     assert a.unit.conversion_factor_to(b.unit) == 1000
 
 
+def test_conversion_factor_to_2():
+    a = PhysicalQuantity(1, 'degC')
+    assert a.unit.conversion_factor_to(a.unit) == 1
+
+
 def test_conversion_tuple_to():
     a = PhysicalQuantity(2, 'm')
     b = PhysicalQuantity(3, 'mm')
     assert a.unit.conversion_tuple_to(b.unit) == (1000.0, 0.0)
 
 
+def test_conversion_tuple_to_self():
+    a = PhysicalQuantity(2, 'degC')
+    assert a.unit.conversion_tuple_to(a.unit) == (1.0, 0.0)
+
+
 def test_conversion_tuple_to_2():
     # raises UnitError
     a = PhysicalQuantity(1, 'm')
@@ -173,93 +259,59 @@ def test_isphysicalunit():
     assert isphysicalunit(1) is False
 
 
-def test_repr():
-    a = PhysicalQuantity(1, 'm').unit
-    b = a.__repr__()
+def test_repr(m_unit):
+    b = m_unit.__repr__()
     assert(b == '<PhysicalUnit m>')
 
 
-def test_latex_repr():
-    a = PhysicalQuantity(1, 'm').unit
-    b = a.latex
+def test_latex_repr(m_unit):
+    b = m_unit.latex
     assert(b == r'\text{m}')
 
 
-def test_gt_1():
-    """Only same units can be compared"""
-    a = PhysicalQuantity(1, 'm').unit
-    b = PhysicalQuantity(1, 's').unit
-    with raises(UnitError):
-        assert (a > b)
-
-
-def test_gt_2():
-    a = PhysicalQuantity(1, 'm').unit
-    b = PhysicalQuantity(1, 'mm').unit
-    assert (a > b)
-
-
-def test_ge_1():
-    """Only same units can be compared"""
-    a = PhysicalQuantity(1, 'm').unit
-    b = PhysicalQuantity(1, 's').unit
-    with raises(UnitError):
-        assert (a >= b)
-
-
-def test_ge_2():
-    a = PhysicalQuantity(1, 'm').unit
-    b = PhysicalQuantity(1, 'mm').unit
-    assert (a >= b)
-
-
-def test_lt_1():
-    """Only same units can be compared"""
-    a = PhysicalQuantity(1, 'm').unit
-    b = PhysicalQuantity(1, 's').unit
-    with raises(UnitError):
-        assert (a < b)
-
+def test_markdown(m_unit):
+    assert m_unit.markdown == r'$\text{m}$'
+    assert str(m_unit) == 'm'
+    b = copy.copy(m_unit)
+    b.set_name('mdtest')
+    assert b.name == 'mdtest'
+    assert str(b) == 'mdtest'
+    assert b.markdown == r'$\text{mdtest}$'
+    assert b._repr_markdown_() == b.markdown
 
-def test_lt_2():
-    a = PhysicalQuantity(1, 'mm').unit
-    b = PhysicalQuantity(1, 'm').unit
-    assert (a < b)
 
-
-def test_le_1():
+@pytest.mark.parametrize('op', [operator.gt, operator.ge, operator.lt, operator.le])
+def test_compare_1(op, m_unit, s_unit):
     """Only same units can be compared"""
-    a = PhysicalQuantity(1, 'm').unit
-    b = PhysicalQuantity(1, 's').unit
     with raises(UnitError):
-        assert (a <= b)
+        assert op(m_unit, s_unit)
 
 
-def test_le_2():
-    a = PhysicalQuantity(1, 'mm').unit
-    b = PhysicalQuantity(1, 'm').unit
-    assert (a <= b)
+@pytest.mark.parametrize('op, expected', [
+    (operator.gt, True), (operator.ge, True), (operator.lt, False), (operator.le, False),
+])
+def test_compare_2(op, expected, m_unit, mm_unit):
+    assert op(m_unit, mm_unit) is expected
+    assert op(mm_unit, m_unit) is not expected
 
 
-def test_pow_1():
+def test_pow_1(m_unit):
     """Only integer exponents"""
     a = PhysicalQuantity(1, 'm^2').unit
-    b = PhysicalQuantity(1, 'm').unit
-    assert(a**0.5 == b)
+    assert(a**0.5 == m_unit)
 
 
-def test_pow_2():
+def test_pow_2(m_unit):
     """Only integer exponents"""
-    a = PhysicalQuantity(1, 'm').unit
     with raises(UnitError):
-        a**2.0
+        m_unit**2.0
 
 
 def test_pow_3():
     """Offsets are not allowed"""
-    addunit(PhysicalUnit('degX', 1., [0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0], offset=273.15))
-    a = PhysicalQuantity(1, 'degX')
-    a.unit.offset = 1.1
+    u = copy.copy(PhysicalQuantity(1, 'K').unit)
+    u.offset = 1.1
+    a = PhysicalQuantity(1, u)
     with raises(UnitError):
         a**2
 
@@ -269,36 +321,62 @@ def test_units_html_list():
     assert(len(a.data) > 1000)
 
 
+@pytest.fixture
+def unit_names():
+    """ Names of units added by a test, removed from the unit_table afterwards """
+    names = []
+    yield names
+    for name in names:
+        unit_table.pop(name, None)
+    _clear_unit_table_caches()
+
+
+def test_units_html_list_2(unit_names):
+    a = units_html_list()
+    unit_names.append(add_composite_unit('htmltest', 1, 'm'))
+    b = units_html_list()
+    assert 'htmltest' not in a.data
+    assert 'htmltest' in b.data
+    # removing and adding a unit keeps the size of the unit_table
+    del unit_table['htmltest']
+    unit_names.append(add_composite_unit('htmltest2', 1, 'm'))
+    c = units_html_list()
+    assert 'htmltest2' in c.data
+
+
 def test_units_list():
     a, b = units_list()
     assert(len(a) > 10)
 
 
-def test_to_dict():
-    a = PhysicalQuantity(1, 'm')
-    d = a.unit.to_dict
-    assert type(d) is dict
-    assert 'base_exponents' in d.keys()
-    assert 'factor' in d.keys()
-    assert 'offset' in d.keys()
-    assert 'name' in d.keys()
+@pytest.fixture
+def unit_dict(m_unit):
+    return m_unit.to_dict
 
 
-def test_to_json():
-    a = PhysicalQuantity(1, 'm')
-    j = a.unit.to_json
-    u = json.loads(j)
+def test_to_dict(unit_dict):
+    assert type(unit_dict) is dict
+    assert 'base_exponents' in unit_dict.keys()
+    assert 'factor' in unit_dict.keys()
+    assert 'offset' in unit_dict.keys()
+    assert 'name' in unit_dict.keys()
+
+
+def test_to_json(m_unit, unit_dict):
+    u = json.loads(m_unit.to_json)
     assert type(u) is dict
-    assert 'PhysicalUnit' in u.keys()
-    d = u['PhysicalUnit']
-    assert 'base_exponents' in d.keys()
-    assert 'factor' in d.keys()
-    assert 'offset' in d.keys()
-    assert 'name' in d.keys()
+    assert u['PhysicalUnit'] == unit_dict
 
 
-def test_from_json():
-    a = PhysicalQuantity(1, 'm')
-    j = a.unit.to_json
-    b = PhysicalUnit.from_json(j)
-    assert a.unit == b
+def test_to_json_2(m_unit):
+    a = copy.copy(m_unit)
+    a.set_name('jsontest')
+    j = a.to_json
+    assert a.to_json is j
+    a.offset = 1
+    assert json.loads(a.to_json)['PhysicalUnit']['offset'] == 1
+
+
+def test_from_json(m_unit):
+    b = PhysicalUnit.from_json(m_unit.to_json)
+    assert m_unit == b